@@ -10,16 +10,21 @@ Description: Extraction et enregistrement des données du feed RSS GDPRHub -
 
             https://gdprhub.eu/index.php?title=Special:NewPages&feed=atom&hideredirs=1&limit=10&render=1
 '''
-import json
+import atexit
 import locale
+import lxml.html
+import orjson
 import os
 import re
-import requests
 import time
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from io import BytesIO
+from lxml import etree
 from pathlib import Path
 from typing import Any
 
@@ -27,20 +32,74 @@ from myDLL.config import settings
 from myDLL.furtif import defUserAgent
 from myDLL.temps import dateActuelle
 from myDLL.texte import saveMDFile
-from myDLL.traduction import deeplTrans, translate_country, translate_sensDecision,translateAcronyme, translate_APD, acronymeAPD_translation
 from myDLL.systeme import clean_filename, logger
 
 BASE_DIR = Path(__file__).parent.resolve()
 
 locale.setlocale(locale.LC_TIME, 'fr_FR.UTF-8')
 
-entrées_traitées = []
+# Noms des mois dans la locale active, calculés une seule fois (équivalent de %B)
+_MOIS = tuple(locale.nl_langinfo(getattr(locale, f'MON_{i}')) for i in range(1, 13))
+
+entrées_traitées = set()
+_nouvelles_entrées = []    # Ajouts non encore écrits dans le fichier de suivi
 
 killText = [
     'Share your comments here!', 
     'Share blogs or news articles here!', 
     'The decision below is a machine translation of the Italian original. Please refer to the Italian original for more details.'
     ]
+_KILL_RE = re.compile('|'.join(re.escape(k) for k in killText))   # Recherche des textes parasites en une passe
+
+# Restriction du parsing BS4 à la seule wikitable (références et URL source).
+# Le strainer reçoit l'attribut class brut ("wikitable sortable") : comparaison par mot de classe
+_RE_CLASSE_WIKITABLE = re.compile(r'(?:^|\s)wikitable(?:\s|$)')
+_WIKITABLE_STRAINER = SoupStrainer('table', class_=_RE_CLASSE_WIKITABLE)
+
+# Espace de noms des balises du flux Atom
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Sélection XPath (lxml) de la table wikitable, classe CSS comparée mot à mot
+_XPATH_WIKITABLE = '//table[contains(concat(" ", normalize-space(@class), " "), " wikitable ")]'
+
+# Expressions régulières compilées une seule fois au chargement du module
+_RE_GDPR_ART = re.compile(r'\|GDPR_Article_\d+=(.*?)<br />')
+_RE_KV = re.compile(r'\|\s*([^=]+)=\s*([^\|]+)')
+_RE_PAREN_TAIL = re.compile(r'\s*\([^)]*\)$')
+_RE_WIKITABLE = re.compile(r'<table[^>]*\bwikitable\b')
+_RE_ART_CLEAN = re.compile(r' GDPR|Article | ')     # " GDPR" -> "RGPD", le reste est supprimé
+
+# Table de suppression des séparateurs et du symbole monétaire dans le quantum
+_QUANTUM_STRIP = str.maketrans('', '', ', €')
+
+# Modules lourds (requests, myDLL.traduction) chargés à la demande par _lazy_imports()
+_SESSION = None
+deeplTrans = acronymeAPD_translation = None
+_translate_country = _translate_sensDecision = _translate_APD = _translateAcronyme = None
+
+def _lazy_imports() -> None:
+    '''
+    Import différé de requests et de myDLL.traduction, au premier appel seulement
+    '''
+    global _SESSION, deeplTrans, acronymeAPD_translation
+    global _translate_country, _translate_sensDecision, _translate_APD, _translateAcronyme
+    if _SESSION is not None:
+        return
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from myDLL.traduction import deeplTrans, translate_country, translate_sensDecision,translateAcronyme, translate_APD, acronymeAPD_translation
+
+    # Mémoïsation des traductions : peu de valeurs distinctes par flux
+    _translate_country = lru_cache(maxsize=512)(translate_country)
+    _translate_sensDecision = lru_cache(maxsize=512)(translate_sensDecision)
+    _translate_APD = lru_cache(maxsize=512)(translate_APD)
+    _translateAcronyme = lru_cache(maxsize=512)(translateAcronyme)
+
+    # Session HTTP persistante (keep-alive) réutilisée entre les appels au flux
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    _SESSION = session
 
 logger = logger(verbose=True, fichierLog=Path(BASE_DIR, "gdprhub.logs"), nom_logger="GDPRHub Logs", console=True)
 
@@ -114,6 +173,7 @@ courtBox = {
         'Appeal_To_Case_Number_Name': 'appel'
     }
 box_types = {'CJEUdecisionBOX': cjeuBox, 'DPAdecisionBOX': apdBox, 'COURTdecisionBOX': courtBox}
+_BOX_DETECT = re.compile('|'.join(re.escape(box_type) for box_type in box_types))   # Détection du type de box en une passe
 
 def formatgdprBox(contenu: DecisionData) -> str:
     '''
@@ -122,6 +182,7 @@ def formatgdprBox(contenu: DecisionData) -> str:
     :param contenu: dictionnaire contenant les éléments nécessaires au formattage de la décision
     :return: Retourne le texte formaté
     '''
+    _lazy_imports()   # Traductions chargées même en appel direct, hors run()/lire_flux_BS4
     
     md_content = f"""---
 aliases: []
@@ -143,7 +204,7 @@ champ: {contenu.champ}
 
 ---
 ```
-{translateAcronyme(contenu.juridiction)}, {contenu.date_titre}, {contenu.nom}n° {contenu.numero}
+{_translateAcronyme(contenu.juridiction)}, {contenu.date_titre}, {contenu.nom}n° {contenu.numero}
 ```
 ---
 #AI_intégrer
@@ -153,23 +214,22 @@ champ: {contenu.champ}
 
     return md_content
 
-def convertir_date_format_iso(date_string: str) -> datetime :
+def convertir_date_format_iso(date_string: str) -> str :
     '''
     Formatter une date au format DD.MM.YYYY en date ISO
     
     :param date_string: string contenant la date au format DD.MM.YYYY
-    :return: objet datetime au format ISO
+    :return: string date au format ISO
     '''
-    # Analyser la date dans le format DD.MM.YYYY
+    # Découper la date DD.MM.YYYY sans passer par strptime ; date() valide jour et mois
     try:
-        date_obj = datetime.strptime(date_string, '%d.%m.%Y')
+        jour, mois, annee = date_string.split('.')
+        # Convertir en format ISO 8601 (YYYY-MM-DD)
+        return date(int(annee), int(mois), int(jour)).isoformat()
     except ValueError:
         # Gérer le cas où la date n'est pas dans le format attendu
         return "Format de date invalide"
 
-    # Convertir en format ISO 8601 (YYYY-MM-DD)
-    return date_obj.strftime('%Y-%m-%d')
-
 def fdate(dateISO: str) -> str:
     '''
     Formatter une date ISO au format d MMMM YYYY
@@ -177,19 +237,15 @@ def fdate(dateISO: str) -> str:
     :param dateISO: string contenant une date au format ISO
     :return: string contenant une date au format d MMMM YYYY
     '''
-    # Convertir la chaîne ISO en objet datetime
-    date_obj = datetime.fromisoformat(dateISO)
-
     # Extraire le jour, le mois en lettres et l'année
-    day = date_obj.day
-    month = date_obj.strftime('%B')
-    year = date_obj.year
+    date_obj = date(*map(int, dateISO.split('-')))
+    day, month, year = date_obj.day, _MOIS[date_obj.month - 1], date_obj.year
 
-    # Formatter le jour correctement
+    # Formatter le jour correctement (int : pas de zéro initial)
     if day == 1:
         day_str = "1er"
     else:
-        day_str = str(day).lstrip('0')  # Enlève le zéro initial pour les jours de 2 à 9
+        day_str = str(day)
 
     # Combiner les éléments en une chaîne formatée
     formatted_date = f"{day_str} {month} {year}"
@@ -208,27 +264,83 @@ def est_traitée(identifiant: str) -> str:
 
 def ajouter_entrée_traitée(identifiant: str) -> bool:
     '''
-    Méthode ajoutant une entrée au fichier de suivi
+    Méthode ajoutant une entrée à la liste de suivi (écrite sur disque par flush_suivi)
     
     :param identifiant: str - identifiant de la décision vérifiée
     :return: bool - True si tout s'est bien passé
     '''
-    entrées_traitées.append(identifiant)
+    if identifiant not in entrées_traitées:
+        entrées_traitées.add(identifiant)
+        _nouvelles_entrées.append(identifiant)
+    return True
+
+def charger_entrées_traitées() -> set:
+    '''
+    Méthode chargeant le fichier de suivi (JSONL, un identifiant par ligne),
+    format partagé avec gdprhubRSS_refactored.
+    Un ancien fichier au format liste JSON est converti une seule fois en JSONL.
+
+    :return: set - identifiants déjà traités
+    '''
+    with open(suivi_fichier, 'rb') as fichier:
+        contenu = fichier.read()
+
+    if contenu.lstrip().startswith(b'['):
+        identifiants = orjson.loads(contenu)
+        with open(suivi_fichier, 'wb') as fichier:
+            fichier.write(b''.join(orjson.dumps(identifiant) + b'\n' for identifiant in identifiants))
+        logger.info(f"💡 Fichier de suivi converti en JSONL: {suivi_fichier}")
+        return set(identifiants)
+
+    return {orjson.loads(ligne) for ligne in contenu.splitlines() if ligne.strip()}
+
+def flush_suivi() -> bool:
+    '''
+    Méthode ajoutant en une fois les nouvelles entrées en fin de fichier de suivi (JSONL)
+    
+    :return: bool - True si tout s'est bien passé (ou rien à écrire)
+    '''
+    if not _nouvelles_entrées:
+        return True
     try:
-        with open(suivi_fichier, 'w') as fichier:
-            json.dump(entrées_traitées, fichier)
-            return True
+        with open(suivi_fichier, 'ab') as fichier:
+            fichier.write(b''.join(orjson.dumps(identifiant) + b'\n' for identifiant in _nouvelles_entrées))
+        _nouvelles_entrées.clear()
+        return True
     except Exception as e:
-        logger.error(f"❗ Erreur à l'ajout de {identifiant} dans le JSON: {e}")
+        logger.error(f"❗ Erreur à l'écriture du JSONL de suivi: {e}")
         return False
 
-def obtenir_references_textuelles(sommaire_HTML: BeautifulSoup, test_mode: bool=False) -> list:
+atexit.register(flush_suivi)   # Filet de sécurité en cas de sortie prématurée
+
+def contient_wikitable(sommaire: str) -> bool:
+    '''
+    Détecte la présence d'un tableau <table class="wikitable"> dans le sommaire HTML
+    
+    :param sommaire: str - sommaire HTML brut
+    :return: bool - True si une wikitable est présente
+    '''
+    return _RE_WIKITABLE.search(sommaire) is not None
+
+def contient_box_wikicode(sommaire: str) -> bool:
+    '''
+    Détecte la présence d'une box wikicode (CJEU, DPA, COURT) dans le sommaire
+    
+    :param sommaire: str - sommaire brut
+    :return: bool - True si un type de box est présent
+    '''
+    return _BOX_DETECT.search(sommaire) is not None
+
+def obtenir_references_textuelles(sommaire_HTML: BeautifulSoup, test_mode: bool=False, summary_soup: BeautifulSoup=None) -> list:
     '''
     
     :param sommaire_HTML: BeautifulSoup - soupe BS4 au format HTML à passer à l'une ou l'autre des fonctions pour extraire les références textuelles
     :param test_mode: bool (facultatif) - Active [TEST MODE]
+    :param summary_soup: BeautifulSoup (facultatif) - soupe déjà parsée, évite un nouveau parsing
     :return: list | None - Liste des références ou None en cas d'erreur
     '''
+    _lazy_imports()   # Dépendances chargées même en appel direct, hors run()/lire_flux_BS4
+
     def extract_griefs_from_Wikitable_html(summary_soup: BeautifulSoup) -> list:
         '''
         Extrait les articles RGPD depuis le tableau HTML.
@@ -246,15 +358,13 @@ def obtenir_references_textuelles(sommaire_HTML: BeautifulSoup, test_mode: bool=
             # La cellule avec les articles est la cellule sœur
             articles_cell = relevant_law_header.find_next_sibling(['td', 'th'])
             if articles_cell:
-                # Trouve tous les liens qui référencent un article
-                for link in articles_cell.find_all('a'):
-                    article_text = link.get_text(strip=True)
-                    # Nettoyage pour avoir un format comme "RGPD-5-1-a"
-                    # article_modifie = article_text.replace("GDPR", "RGPD").replace("Article", "").replace(" ", "-")
-                    article_modifie = article_text.replace(" GDPR", "RGPD").replace("Article ", "").replace(" ", "")
-                    if article_modifie:
-                        articles_rgpd.append(article_modifie)
-        return articles_rgpd
+                # Trouve tous les liens qui référencent un article, nettoyés en une seule passe regex
+                # article_modifie = article_text.replace("GDPR", "RGPD").replace("Article", "").replace(" ", "-")
+                articles_rgpd = [
+                    _RE_ART_CLEAN.sub(lambda m: 'RGPD' if m.group() == ' GDPR' else '', link.get_text(strip=True))
+                    for link in articles_cell.find_all('a')
+                ]
+        return [article for article in articles_rgpd if article]
 
     def extract_griefs_from_Wikicode(texte: str) -> list:
         '''
@@ -264,7 +374,7 @@ def obtenir_references_textuelles(sommaire_HTML: BeautifulSoup, test_mode: bool=
         :return: liste contenant les articles
         '''
         # Recherche des champs GDPR_Article_X dans le texte
-        matches = re.findall(r'\|GDPR_Article_\d+=(.*?)<br />', texte)
+        matches = _RE_GDPR_ART.findall(texte)
         
         # Liste pour stocker les valeurs modifiées
         articles_rgpd = []
@@ -290,26 +400,26 @@ def obtenir_references_textuelles(sommaire_HTML: BeautifulSoup, test_mode: bool=
         '''
         pass
 
-    try:
-        # Parsing de la soupe HTML pour tenter extraction Wikitable
-        soupe_parsee = BeautifulSoup(sommaire_HTML, 'html.parser') # Crée un nouvel objet soup pour l'analyser
+    def extract_Wikitable() -> list:
+        if summary_soup is not None:
+            soupe_parsee = summary_soup
+        else:
+            soupe_parsee = BeautifulSoup(sommaire_HTML, 'lxml', parse_only=_WIKITABLE_STRAINER) # Crée un nouvel objet soup pour l'analyser
         return extract_griefs_from_Wikitable_html(summary_soup=soupe_parsee)
-    
-    except Exception as e:          # Echec du parsing Wikitable
-        logger.warning(f"⚠️ Echec du parsing Wikitable: {e}")
 
-        try:
-            # Tentative de parsing Wikicode
-            return extract_griefs_from_Wikicode(texte=sommaire_HTML)
-        
-        except Exception as e:      # Echec du parsing Wikicode
-            logger.warning(f"⚠️ Echec du parsing Wikicode: {e}")
+    # Stratégies testées dans l'ordre : (nom, détection, extraction)
+    strategies = [
+        ('Wikitable', contient_wikitable, extract_Wikitable),
+        ('Wikicode', contient_box_wikicode, lambda: extract_griefs_from_Wikicode(texte=sommaire_HTML)),
+        ('Prose', lambda sommaire: True, lambda: extract_griefs_from_prose(sommaire_HTML)),
+    ]
+
+    for nom, detecter, extraire in strategies:
+        if detecter(sommaire_HTML):
             try:
-                # Todo parsing prose
-                return extract_griefs_from_prose(sommaire_HTML)
-            
-            except Exception as e:  # Echec général du parsing
-                logger.warning(f"⚠️ Echec du parsing prose: {e}")
+                return extraire()
+            except Exception as e:
+                logger.warning(f"⚠️ Echec du parsing {nom}: {e}")
                 return None
 
     
@@ -338,24 +448,67 @@ def extract_url_src(summary_soup: BeautifulSoup) -> list:
         else:
             return ""
 
-def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False, test_mode: bool=False) -> Any:
+def arbre_sommaire(summary_html: str):
+    '''
+    Construit l'arbre lxml.html du sommaire
+
+    :param summary_html: str - sommaire HTML brut
+    :return: arbre lxml.html, ou None si le sommaire ne contient aucun élément (vide, commentaire seul...)
+    '''
+    try:
+        return lxml.html.fromstring(summary_html)
+    except etree.ParserError:   # "Document is empty"
+        return None
+
+def extraire_section(summary_tree, span_id: str, titres: tuple=('h3',), arret_killText: bool=False) -> str:
+    '''
+    Extrait le texte d'une section (Facts, Holding, Comment) depuis l'arbre lxml du sommaire
+
+    :param summary_tree: arbre lxml.html du sommaire (ou None)
+    :param span_id: str - id du <span> porté par le titre de la section
+    :param titres: tuple - balises titre pouvant contenir le <span>
+    :param arret_killText: bool - arrêter la section sur un des textes de killText
+    :return: str - texte de la section, un élément par ligne
+    '''
+    if summary_tree is None:
+        return ""
+
+    condition = ' or '.join(f'self::{titre}' for titre in titres)
+    headings = summary_tree.xpath(f'(//span[@id=$sid])[1]/ancestor::*[{condition}][1]', sid=span_id)
+    if not headings:
+        return ""
+
+    contenu = ""
+    for sibling in headings[0].itersiblings(tag=etree.Element):
+        if arret_killText and _KILL_RE.search(sibling.text_content()):  # Rubrique vierge, on passe
+            break
+        if sibling.tag.startswith('h'):                                 # Arrêter au prochain titre
+            break
+        # Équivalent lxml de get_text(separator=' ', strip=True)
+        contenu += ' '.join(t.strip() for t in sibling.itertext() if t.strip()) + '\n'
+    return contenu
+
+def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False, test_mode: bool=False, summary_tree=None) -> Any:
     '''
     
     :param : 
+    :param summary_tree: lxml.html.HtmlElement (facultatif) - arbre lxml déjà construit pour le sommaire
     :param test_mode: bool (facultatif) - Active [TEST MODE]
     :return: 
     '''
+    _lazy_imports()   # Traductions chargées même en appel direct, hors run()/lire_flux_BS4
     pass
 
-    def parser_Wikitable(summary_soup: BeautifulSoup, artRGPD: list, src: str, test_mode: bool=False) -> DecisionData:
+    def parser_Wikitable(summary_html: str, artRGPD: list, src: str, test_mode: bool=False, summary_tree=None) -> DecisionData:
         '''
         Extrait les métadonnées de manière simple et robuste, nettoie le nom de
         la juridiction, et retourne un dictionnaire complet.
 
-        :param summary_soup: BeautifulSoup - soup BS4 parsée en BS
+        :param summary_html: str - sommaire HTML brut, parsé avec lxml
         :param artRGPD: list
         :param src: str
         :param test_mode: bool
+        :param summary_tree: lxml.html.HtmlElement (facultatif) - arbre déjà parsé, réutilisé tel quel
         :return: DecisionData - classe DecisionData complétée ou non
         '''
         # ÉTAPE 1 : LE MAPPING CORRIGÉ (SANS LES ':')
@@ -379,27 +532,30 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
         }
 
 
-        table = summary_soup.find('table', class_='wikitable')
-        if not table:
+        if summary_tree is None:
+            summary_tree = arbre_sommaire(summary_html)
+        if summary_tree is None:    # Sommaire sans élément HTML : pas de table
+            return None
+        tables = summary_tree.xpath(_XPATH_WIKITABLE)
+        if not tables:
             return None
 
-        # On parcourt la table pour remplir les données brutes.
-        for row in table.find_all('tr'):
-            cells = row.find_all(['th', 'td'])
-            if len(cells) == 2:
-                # On nettoie la clé D'ABORD
-                key = cells[0].get_text(strip=True).replace(':', '')
-                value = cells[1].get_text(strip=True)
-                
-                # On vérifie si la clé nettoyée est dans notre mapping
-                if key in key_mapping:
-                    attribute_name = key_mapping[key]
-                    setattr(d, attribute_name, value)
+        # On parcourt les lignes à deux cellules (sélection XPath faite en C)
+        for row in tables[0].xpath('.//tr[count(th|td)=2]'):
+            key_cell, value_cell = row.xpath('th|td')
+            # On nettoie la clé D'ABORD
+            key = ''.join(t.strip() for t in key_cell.itertext()).replace(':', '')
+            value = ''.join(t.strip() for t in value_cell.itertext())
+            
+            # On vérifie si la clé nettoyée est dans notre mapping
+            if key in key_mapping:
+                attribute_name = key_mapping[key]
+                setattr(d, attribute_name, value)
 
         # ÉTAPE 2 : NETTOYAGE FINAL
         if d.juridiction and d.juridiction != 'NON_DEFINI':
             # On lit et on réassigne directement à l'attribut
-            d.juridiction = re.sub(r'\s*\([^)]*\)$', '', d.juridiction).strip()
+            d.juridiction = _RE_PAREN_TAIL.sub('', d.juridiction).strip()
         else:
             logger.warning(f"⚠️ Juridiction non trouvée (vérifier le mapping).")
             d.juridiction = "NON_DEFINI" # S'assurer que la valeur par défaut est bien là
@@ -412,13 +568,13 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
             d.URLsrc= src
 
         if d.pays:
-            d.pays = translate_country(d.pays)
+            d.pays = _translate_country(d.pays)
 
-        d.type = translate_sensDecision(d.type)
+        d.type = _translate_sensDecision(d.type)
         d.outcome = "amende" if d.quantum and d.quantum.strip().lower() not in ['', 'n/a'] else []
         
         qt = d.quantum.strip()
-        qt_clean = qt.replace(',', '').replace(' ', '').replace('€', '')
+        qt_clean = qt.translate(_QUANTUM_STRIP)
         d.quantum = qt_clean if qt_clean.isdigit() else ""
 
         if d.date:
@@ -430,13 +586,13 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
 
         d.date_actuelle = dateActuelle()
         d.champ = 'sanctionCNIL' if acronymeAPD_translation.get(d.juridiction, '') == "CNIL" else []
-        d.apd_traduite = translate_APD(d.juridiction)
+        d.apd_traduite = _translate_APD(d.juridiction)
 
         idParties = d.nom
         idParties = "" if idParties.lower() in ["n/a", ""] else idParties + ", "
         d.nom = idParties
         
-        juridAcro = translateAcronyme(d.juridiction)
+        juridAcro = _translateAcronyme(d.juridiction)
 
         d.proposed_filename = f"{juridAcro}, {d.date_titre}, n° {d.numero}"
         
@@ -453,24 +609,26 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
         :return: dictionnaire avec le contenu du tableau mappé
         '''
         # Identifier le type de box
-        for box_type in box_types:
-            if box_type in summary:
-                box_dict = box_types[box_type]
-                break
-        else:
+        box_match = _BOX_DETECT.search(summary)
+        if not box_match:
             # return None  # Si aucun type de box n'est trouvé, retourner None
             return DecisionData() # Si aucun type de box n'est trouvé, renvoyer une DecisionData vierge
+        box_type = box_match.group()
+        box_dict = box_types[box_type]
 
         box_data = {}
         d = DecisionData()
 
-        pattern = re.compile(r'\|\s*([^=]+)=\s*([^\|]+)')
-        matches = pattern.findall(summary)
+        matches = _RE_KV.findall(summary)
 
         for key, value in matches:
             adjusted_key = key.strip()
             if adjusted_key in box_dict:
-                box_data[box_dict[adjusted_key]] = value.strip().replace('\n', ' ').strip()
+                box_data[box_dict[adjusted_key]] = value.strip().replace('\n', ' ')
+
+        # Report des champs de la box sur la décision
+        for attribut, valeur in box_data.items():
+            setattr(d, attribut, valeur)
         
         if box_type == 'CJEUdecisionBOX' and ('juridiction' not in box_data or not box_data['juridiction']):
             # box_data['juridiction'] = 'CJUE'
@@ -484,13 +642,13 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
         if 'pays' in box_data:
             try:
                 # box_data['pays'] = translate_country(box_data['pays'])
-                d.pays=translate_country(d.pays)
+                d.pays=_translate_country(d.pays)
             except Exception as e:
                 logger.error(f"❗ Erreur translate_country: {e}")
 
         # Ajouter ici le nom de fichier proposé sans extension, avec traduction éventuelle
         # box_data['type'] = translate_sensDecision(box_data['type']) if box_data.get('type') else ''
-        d.type = translate_sensDecision(d.type) if d.type else ''
+        d.type = _translate_sensDecision(d.type) if d.type else ''
         
         
 
@@ -513,7 +671,7 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
 
         d.date_actuelle = dateActuelle()
         d.champ = 'sanctionCNIL' if acronymeAPD_translation.get(d.juridiction, d.juridiction) == "CNIL" else []
-        d.apd_traduite = translate_APD(d.juridiction)
+        d.apd_traduite = _translate_APD(d.juridiction)
         
         idParties = d.nom
         if idParties == "n/a" or idParties == "" :
@@ -524,9 +682,9 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
         d.date_titre = fdate(d.date_convertie)
 
         juridAcro = d.juridiction
-        juridAcro = translateAcronyme(juridAcro)
+        juridAcro = _translateAcronyme(juridAcro)
 
-        d.proposed_filename = ''.join([juridAcro, ', ', d.date_titre, ', ', idParties, 'n° ', d.numero])
+        d.proposed_filename = f"{juridAcro}, {d.date_titre}, {idParties}n° {d.numero}"
 
         return d
 
@@ -550,31 +708,41 @@ def parser_contenu(summary, src: str, artRGPD: list= None, cleanHTML: bool=False
 
 
 
-    try:
-        # Parsing de la soupe HTML pour tenter extraction Wikitable
-        soupe_parsee = BeautifulSoup(summary, 'html.parser') # Crée un nouvel objet soup pour l'analyser
-        return parser_Wikitable(soupe_parsee, artRGPD, src)
-    
-    except Exception as e:          # Echec du parsing Wikitable
-        logger.warning(f"⚠️ Echec du parsing Wikitable: {e}")
+    # Stratégies testées dans l'ordre : (nom, détection, parsing)
+    strategies = [
+        ('Wikitable', contient_wikitable, lambda: parser_Wikitable(summary, artRGPD, src, summary_tree=summary_tree)),
+        ('Wikicode', contient_box_wikicode, lambda: parser_Wikicode_regex(summary, artRGPD, cleanHTML)),
+        ('Prose', lambda sommaire: True, parser_prose),
+    ]
 
-        try:
-            # Tentative de parsing Wikicode
-            return parser_Wikicode_regex(summary, artRGPD, cleanHTML)
-        
-        except Exception as e:      # Echec du parsing Wikicode
-            logger.warning(f"⚠️ Echec du parsing Wikicode: {e}")
+    for nom, detecter, parser in strategies:
+        if detecter(summary):
             try:
-                # Todo parsing prose
-                return parser_prose()
-            
-            except Exception as e:  # Echec général du parsing
-                logger.warning(f"⚠️ Echec du parsing prose: {e}")
+                d = parser()
+            except Exception as e:
+                logger.warning(f"⚠️ Echec du parsing {nom}: {e}")
                 return None
+            if d:
+                d.parsing_strategy = nom
+            return d
 
     
 
 
+def iter_entrees_atom(contenu: bytes):
+    '''
+    Générateur parcourant les entrées d'un flux Atom au fil du parsing (lxml.iterparse),
+    chaque entrée étant libérée une fois traitée
+    
+    :param contenu: bytes - contenu brut du flux
+    :return: tuples (identifiant, sommaire HTML) pour chaque entrée
+    '''
+    for _, entry in etree.iterparse(BytesIO(contenu), tag=f'{_ATOM_NS}entry'):
+        yield entry.findtext(f'{_ATOM_NS}id', ''), entry.findtext(f'{_ATOM_NS}summary', '')
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
 def lire_flux_BS4(url, test_mode: bool=False) -> list[DecisionData]:
     '''
     Méthode lisant le flux RSS fourni et permettant un nettoyage du texte HTML
@@ -582,95 +750,74 @@ def lire_flux_BS4(url, test_mode: bool=False) -> list[DecisionData]:
     :param url: str - URL du feed
     :return: list[DecisionData] - liste d'articles
     '''
+    _lazy_imports()
+
     user_agent = defUserAgent()
     headers = {
-        "User-Agent": user_agent
+        "User-Agent": user_agent,
+        "Accept-Encoding": "gzip"
     }
 
-    response = requests.get(url, headers=headers)
-
-    soup = BeautifulSoup(response.content, 'xml')
-
-    entries = soup.find_all('entry')
-    if test_mode:
-        logger.debug(f"🔍🛠️ Nombre d'entrées trouvées avec BeautifulSoup: {len(entries)}")
+    response = _SESSION.get(url, headers=headers, timeout=10)
 
     articles = []
+    textes = []     # Textes à traduire, dans le même ordre que articles
+    nb_entrees = 0
 
-    for entry in entries:
-        entry_id = entry.find('id').text
-        summary_html = entry.find('summary').text # Récupère le contenu HTML de la balise summary
-        summary_soup = BeautifulSoup(summary_html, 'html.parser') # Crée un nouvel objet soup pour l'analyser
-
+    for entry_id, summary_html in iter_entrees_atom(response.content):
+        nb_entrees += 1
 
-        if test_mode or not est_traitée(entry_id):
-            # artRGPD = extract_griefs_from_Wikitable_html(summary_soup)
-            artRGPD = obtenir_references_textuelles(summary_html)
-            src = extract_url_src(summary_soup)
-        
-            # decision_data = parser_Wikitable(summary_soup, artRGPD, src)
-            decision_data = parser_contenu(
-                summary=summary_html, 
-                src=src, 
-                artRGPD=artRGPD, 
-                cleanHTML=False, 
-                test_mode=False)
-
-            if not decision_data:
-                    #input('pause car box - none') # Commenté le 26 06 24 car les none proviennent de pb sur le site
-                    logger.warning(f"\n⚠️ Boxdata vide pour: {entry_id}\n")
-                    decision_data = DecisionData()
-                    decision_data.id= entry_id
-                    decision_data.griefs = 'Erreur' # Ajout 26 06 24 pour tracer les fiches problématiques
-                    decision_data.proposed_filename = time.strftime(f"GDPRHub-%Y%m%d%H%M%S")
-
-            facts_heading = summary_soup.find('span', id='Facts')
-            facts_content = ""
-            if facts_heading:
-                # Itérer sur les éléments frères qui suivent le titre
-                for sibling in facts_heading.find_parent('h3').find_next_siblings():
-                    if sibling.name.startswith('h'): # Arrêter au prochain titre
-                        break
-                    if hasattr(sibling, 'text'):
-                        facts_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            holding_heading = summary_soup.find('span', id="Holding")
-            holding_content = ""
-            if holding_heading:
-                for sibling in holding_heading.find_parent('h3').find_next_siblings():
-                    if sibling.name.startswith('h'): # Arrêter au prochain titre
-                        break
-                    if hasattr(sibling, 'text'):
-                        holding_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            cmtr_heading = summary_soup.find('span', id="Comment")
-            cmtr_content = ""
-            if cmtr_heading:
-                # On cherche le parent, qui peut être h2 ou h3 (plus flexible)
-                parent_heading = cmtr_heading.find_parent(['h2', 'h3'])
-                
-                # On vérifie que le parent a bien été trouvé AVANT de continuer
-                if parent_heading:
-                    for sibling in parent_heading.find_next_siblings():
-                        if 'Share your comments here!' in sibling.get_text():   # Rubrique vierge, on passe
-                            break
-                        if sibling.name.startswith('h'):                        # Arrêter au prochain titre
-                            break
-                        if hasattr(sibling, 'text'):
-                            cmtr_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            txt = '\n'.join([facts_content, "# Décision", holding_content, "# Commentaire", cmtr_content])
-            
-            txt_FR = deeplTrans(txt)
+        # Court-circuit avant tout parsing HTML si l'entrée est déjà connue
+        if not test_mode and est_traitée(entry_id):
+            logger.info(f"💡 Déjà traité: {entry_id}")
+            continue
+
+        summary_soup = BeautifulSoup(summary_html, 'lxml', parse_only=_WIKITABLE_STRAINER) # Crée un nouvel objet soup pour l'analyser
+        summary_tree = arbre_sommaire(summary_html)  # Arbre lxml pour les sections (None si sommaire vide)
+
+        # artRGPD = extract_griefs_from_Wikitable_html(summary_soup)
+        artRGPD = obtenir_references_textuelles(summary_html, summary_soup=summary_soup)
+        src = extract_url_src(summary_soup)
+
+        # decision_data = parser_Wikitable(summary_soup, artRGPD, src)
+        decision_data = parser_contenu(
+            summary=summary_html, 
+            src=src, 
+            artRGPD=artRGPD, 
+            cleanHTML=False, 
+            test_mode=False,
+            summary_tree=summary_tree)
+
+        if not decision_data:
+                #input('pause car box - none') # Commenté le 26 06 24 car les none proviennent de pb sur le site
+                logger.warning(f"\n⚠️ Boxdata vide pour: {entry_id}\n")
+                decision_data = DecisionData()
+                decision_data.id= entry_id
+                decision_data.griefs = 'Erreur' # Ajout 26 06 24 pour tracer les fiches problématiques
+                decision_data.proposed_filename = time.strftime(f"GDPRHub-%Y%m%d%H%M%S")
+
+        facts_content = extraire_section(summary_tree, 'Facts')
+        holding_content = extraire_section(summary_tree, 'Holding')
+        # Le titre du commentaire peut être h2 ou h3 (plus flexible)
+        cmtr_content = extraire_section(summary_tree, 'Comment', titres=('h2', 'h3'), arret_killText=True)
+
+        txt = '\n'.join([facts_content, "# Décision", holding_content, "# Commentaire", cmtr_content])
+
+        decision_data.id = entry_id
+        decision_data.rss = True
+
+        articles.append(decision_data)
+        textes.append(txt)
+        # ajouter_entrée_traitée(entry_id) # Déplacé à après l'enregistrement du MD
 
-            decision_data.id = entry_id
-            decision_data.texte_FR = txt_FR
-            decision_data.rss = True
+    if test_mode:
+        logger.debug(f"🔍🛠️ Nombre d'entrées trouvées dans le flux: {nb_entrees}")
 
-            articles.append(decision_data)
-            # ajouter_entrée_traitée(entry_id) # Déplacé à après l'enregistrement du MD
-        else:
-            logger.info(f"💡 Déjà traité: {entry_id}")
+    # Traductions DeepL indépendantes : appels réseau lancés en parallèle
+    if textes:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for decision_data, txt_FR in zip(articles, executor.map(deeplTrans, textes)):
+                decision_data.texte_FR = txt_FR
 
     return articles
 
@@ -682,6 +829,8 @@ def run(test_mode: bool=False) -> None:
     :return: aucun retour attendu
     '''
     global entrées_traitées
+
+    _lazy_imports()
     
     print('\n\n\n\t\t*** RSS GDPRHub ***\n')
     # rss_url = read_key_from_yaml('gdprhub', 'RSS')
@@ -690,13 +839,12 @@ def run(test_mode: bool=False) -> None:
 
     if os.path.exists(suivi_fichier) and not test_mode:
         try:
-            with open(suivi_fichier, 'r') as fichier:
-                entrées_traitées = json.load(fichier)
+            entrées_traitées = charger_entrées_traitées()
         except Exception as e:
-            logger.error(f"❗ Erreur lors du chargement du JSON: {e}")
-            entrées_traitées = []
+            logger.error(f"❗ Erreur lors du chargement du JSONL: {e}")
+            entrées_traitées = set()
     else:
-        entrées_traitées = []
+        entrées_traitées = set()
 
     articles = lire_flux_BS4(rss_url, True)
     if test_mode:
@@ -737,6 +885,7 @@ def run(test_mode: bool=False) -> None:
         elif not s and not test_mode:
              logger.error(f"❌ L'enregistrement a échoué pour {article.id}. L'article n'est PAS ajouté au suivi.")
         
+    flush_suivi()
 
     logger.info(f"💡 Fin du feed GDPRHub")
 
@@ -16,13 +16,19 @@ import locale
 import os
 import re
 import requests
+import threading
 import time
 
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from io import BytesIO
+from lxml import etree
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import Any, Optional, Tuple, List, Dict
 
 from myDLL.config import settings
@@ -36,7 +42,15 @@ BASE_DIR = Path(__file__).parent.resolve()
 
 locale.setlocale(locale.LC_TIME, 'fr_FR.UTF-8')
 
-entrées_traitées = []
+entrées_traitées = set()
+_SUIVI_LOCK = threading.Lock()
+_MAX_WORKERS = 8
+
+# Session HTTP partagée (keep-alive, réutilisation des connexions TCP/TLS)
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": defUserAgent()})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 killText = [
     'Share your comments here!',
@@ -44,6 +58,48 @@ killText = [
     'The decision below is a machine translation of the Italian original. Please refer to the Italian original for more details.'
 ]
 
+# Balises du flux Atom lues en flux par lxml.etree.iterparse
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_ATOM_ENTRY = f'{_ATOM_NS}entry'
+_ATOM_ID = f'{_ATOM_NS}id'
+_ATOM_SUMMARY = f'{_ATOM_NS}summary'
+
+# Balise ouvrante et valeur brute de son attribut class (guillemets doubles, simples ou sans)
+_TAG_CLASSE = r'<{tag}\b[^>]*?\sclass\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<nq>[^\s>]+))'
+
+
+def _regex_classe(tag_class: str) -> re.Pattern:
+    '''
+    Mot de classe CSS dans la valeur brute d'un attribut class ("wikitable sortable").
+    Règle commune à la sonde textuelle et au SoupStrainer, qui reçoit lui aussi la chaîne brute.
+
+    :param tag_class: str - classe recherchée
+    :return: re.Pattern - motif à appliquer sur la valeur de l'attribut
+    '''
+    return re.compile(rf'(?:^|\s){re.escape(tag_class)}(?:\s|$)')
+
+# Identifiants des sections de texte extraites du sommaire
+_SECTIONS_IDS = ['Facts', 'Holding', 'Comment']
+
+# Nettoyage de la parenthèse finale du nom de juridiction, ex: "CNIL (France)"
+_JURID_PAREN_RE = re.compile(r'\s*\([^)]*\)$')
+
+# Normalisation des articles RGPD en une seule passe (au lieu de replace() chaînés)
+_ARTICLE_SUB = re.compile(r' GDPR|Article | ')
+_ARTICLE_MAP = {' GDPR': 'RGPD', 'Article ': '', ' ': ''}
+_ARTICLE_WIKICODE_SUB = re.compile(r'GDPR|Article| ')
+_ARTICLE_WIKICODE_MAP = {'GDPR': 'RGPD', 'Article': '', ' ': ''}
+
+# Caractères retirés du montant de l'amende
+_QUANTUM_STRIP = str.maketrans('', '', ', €')
+
+# Traductions invariantes et juridictions très répétées d'une entrée à l'autre : mémoïsation
+_cached_translate_APD = lru_cache(maxsize=512)(translate_APD)
+_cached_translateAcronyme = lru_cache(maxsize=512)(translateAcronyme)
+
+# Date du jour, calculée une seule fois au lancement de run()
+_DATE_ACTUELLE = None
+
 logger = logger(verbose=True, fichierLog=Path(BASE_DIR, "gdprhub.logs"), nom_logger="GDPRHub Logs", console=True)
 suivi_fichier = settings.Feeds.GDPRjson
 
@@ -52,7 +108,7 @@ suivi_fichier = settings.Feeds.GDPRjson
 # DATACLASSES - Données de décision
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DecisionData:
     """Classe représentant une décision RGPD"""
     id: str = ""
@@ -64,16 +120,25 @@ class DecisionData:
     quantum: str = ""
     date: str = ""
     griefs: list = field(default_factory=list)
+    griefs_raw: list = field(default_factory=list)
     URLsrc: str = ""
     nom: str = ""
 
+    # Champs secondaires renseignés par les box wikicode
+    typeoriginal: str = ""
+    partie2: str = ""
+    appel: str = ""
+    juridEN: str = ""
+    ccl: str = ""
+
     # Champs pour le post-traitement
     apd_traduite: str = ""
-    date_convertie: str = ""
-    date_titre: str = ""
+    date_convertie: str = '1601-01-01'
+    date_titre: str = "1er janvier 1601"
     date_actuelle: str = ""
     champ: str = ""
     proposed_filename: str = ""
+    juridAcro: str = ""
 
     # Contenu textuel
     texte_brut: str = ""
@@ -88,13 +153,17 @@ class DecisionData:
 # DATACLASSES - Configuration des parsers
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParserConfig:
     """
     Classe mère pour la configuration des parsers.
     Définit les éléments HTML/XML à rechercher et la stratégie de mapping.
+
+    Les configurations sont déclarées avec slots=True : les sous-classes slotées
+    appellent ParserConfig.__post_init__(self) explicitement, super() sans argument
+    ne fonctionnant pas avec la classe recréée par dataclass.
     """
-    name: str
+    name: str = ""
     # Tags à rechercher : (nom_tag, classe_css ou attribut)
     content_tags: Tuple[str, str] = ("table", "wikitable")
     reference_tags: Tuple[str, str] = ("table", "wikitable")
@@ -106,17 +175,25 @@ class ParserConfig:
     # Patterns regex si nécessaire
     regex_patterns: Dict[str, str] = field(default_factory=dict)
 
+    # Patterns regex compilés (construits depuis regex_patterns)
+    compiled_patterns: Dict[str, re.Pattern] = field(default_factory=dict)
+
     def __post_init__(self):
         """Initialisation par défaut du key_mapping si vide"""
         if not self.key_mapping:
             self.key_mapping = self._default_key_mapping()
+        self.compile_patterns()
+
+    def compile_patterns(self) -> None:
+        """Compile une seule fois les regex_patterns (à rappeler après les avoir modifiés)"""
+        self.compiled_patterns = {k: re.compile(v) for k, v in self.regex_patterns.items()}
 
     def _default_key_mapping(self) -> Dict[str, str]:
         """Mapping par défaut (peut être surchargé)"""
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class WikitableParserConfig(ParserConfig):
     """Configuration pour parser les tableaux Wikitable HTML"""
 
@@ -125,7 +202,7 @@ class WikitableParserConfig(ParserConfig):
         self.content_tags = ("table", "wikitable")
         self.reference_tags = ("table", "wikitable")
         self.source_tags = ("table", "wikitable")
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
     def _default_key_mapping(self) -> Dict[str, str]:
         return {
@@ -147,20 +224,27 @@ class WikitableParserConfig(ParserConfig):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WikicodeParserConfig(ParserConfig):
     """Configuration pour parser le wikicode (format texte avec pipes)"""
 
+    # Mapping des champs par type de box wikicode
+    box_mappings: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    # Détection de n'importe quel type de box en une seule passe
+    box_type_pattern: Optional[re.Pattern] = None
+
     def __post_init__(self):
         self.name = "Wikicode"
         # Pas de tags HTML pour le wikicode, on utilise des regex
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
         # Patterns regex spécifiques au wikicode
         self.regex_patterns = {
             'field_pattern': r'\|\s*([^=]+)=\s*([^\|]+)',
             'article_pattern': r'\|GDPR_Article_\d+=(.*?)<br />'
         }
+        self.compile_patterns()
 
         # Box types pour wikicode
         self.box_mappings = {
@@ -201,15 +285,16 @@ class WikicodeParserConfig(ParserConfig):
                 'Appeal_To_Case_Number_Name': 'appel'
             }
         }
+        self.box_type_pattern = re.compile('|'.join(map(re.escape, self.box_mappings.keys())))
 
 
-@dataclass
+@dataclass(slots=True)
 class ProseParserConfig(ParserConfig):
     """Configuration pour parser le contenu en prose (texte libre)"""
 
     def __post_init__(self):
         self.name = "Prose"
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
         # Patterns regex pour extraire des infos du texte libre
         self.regex_patterns = {
@@ -217,6 +302,7 @@ class ProseParserConfig(ParserConfig):
             'date': r'On (\d{1,2} \w+ \d{4})',
             'authority': r'title.*?\((.+?)\)',  # Du title de l'entrée
         }
+        self.compile_patterns()
 
 
 # ============================================================================
@@ -226,9 +312,21 @@ class ProseParserConfig(ParserConfig):
 class Parser(ABC):
     """Classe abstraite pour les parsers"""
 
+    # True si le parser accepte directement une soupe BS4 déjà construite
+    accepte_soupe: bool = False
+    # Griefs formatés entre guillemets ("5(1)(a)RGPD") lors du post-traitement
+    griefs_entre_guillemets: bool = True
+
     def __init__(self, config: ParserConfig):
         self.config = config
 
+    @staticmethod
+    def _as_soup(content: Any, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Retourne la soupe BS4 du contenu, sans re-parser si elle est déjà construite"""
+        if isinstance(content, BeautifulSoup):
+            return content
+        return BeautifulSoup(content, 'lxml', parse_only=parse_only)
+
     @abstractmethod
     def can_parse(self, content: Any) -> bool:
         """Vérifie si ce parser peut traiter le contenu"""
@@ -248,7 +346,7 @@ class Parser(ABC):
         """Post-traitement commun à tous les parsers"""
         # Nettoyage juridiction
         if decision.juridiction and decision.juridiction != 'NON_DEFINI':
-            decision.juridiction = re.sub(r'\s*\([^)]*\)$', '', decision.juridiction).strip()
+            decision.juridiction = _JURID_PAREN_RE.sub('', decision.juridiction).strip()
         else:
             decision.juridiction = "NON_DEFINI"
 
@@ -259,26 +357,25 @@ class Parser(ABC):
         # Traduction type
         decision.type = translate_sensDecision(decision.type)
 
-        # Outcome
-        decision.outcome = "amende" if decision.quantum and decision.quantum.strip().lower() not in ['', 'n/a'] else []
+        # Griefs (liste brute renseignée par le parser, formatage mémoïsé)
+        if decision.griefs_raw:
+            decision.griefs = _format_griefs(tuple(decision.griefs_raw), self.griefs_entre_guillemets)
 
-        # Quantum
-        if decision.quantum:
-            qt = decision.quantum.strip()
-            qt_clean = qt.replace(',', '').replace(' ', '').replace('€', '')
-            decision.quantum = qt_clean if qt_clean.isdigit() else ""
+        # Outcome et quantum (montant nettoyé une seule fois)
+        qt = decision.quantum.strip() if decision.quantum else ''
+        decision.outcome = "amende" if qt and qt.lower() != 'n/a' else []
 
-        # Dates
+        qt_clean = qt.translate(_QUANTUM_STRIP)
+        decision.quantum = qt_clean if qt_clean.isdigit() else ""
+
+        # Dates (valeurs par défaut de DecisionData si absente)
         if decision.date:
             decision.date_convertie = convertir_date_format_iso(decision.date)
             decision.date_titre = fdate(decision.date_convertie)
-        else:
-            decision.date_convertie = '1601-01-01'
-            decision.date_titre = "1er janvier 1601"
 
-        decision.date_actuelle = dateActuelle()
+        decision.date_actuelle = _DATE_ACTUELLE or dateActuelle()
         decision.champ = 'sanctionCNIL' if acronymeAPD_translation.get(decision.juridiction, '') == "CNIL" else []
-        decision.apd_traduite = translate_APD(decision.juridiction)
+        decision.apd_traduite = _cached_translate_APD(decision.juridiction)
 
         # Nom
         idParties = decision.nom
@@ -286,30 +383,53 @@ class Parser(ABC):
         decision.nom = idParties
 
         # Filename
-        juridAcro = translateAcronyme(decision.juridiction)
-        decision.proposed_filename = f"{juridAcro}, {decision.date_titre}, n° {decision.numero}"
+        decision.juridAcro = _cached_translateAcronyme(decision.juridiction)
+        decision.proposed_filename = f"{decision.juridAcro}, {decision.date_titre}, n° {decision.numero}"
 
         decision.parsing_strategy = self.config.name
 
         return decision
 
 
+def _cell_text(cell) -> str:
+    """Texte d'une cellule, équivalent à get_text(strip=True) (accès direct si un seul nœud texte)"""
+    s = cell.string
+    # .string renvoie aussi un commentaire seul (Comment hérite de NavigableString) : texte simple uniquement
+    if type(s) is NavigableString:
+        return s.strip()
+    return ''.join(cell.stripped_strings)
+
+
 class WikitableParser(Parser):
     """Parser pour les tableaux Wikitable HTML"""
 
+    accepte_soupe = True
+
+    def __init__(self, config: ParserConfig):
+        super().__init__(config)
+        # Même règle (mot de classe) pour la sonde textuelle et le strainer du parsing :
+        # un contenu accepté par can_parse garde sa table une fois parsé
+        tag_name, tag_class = self.config.content_tags
+        self._classe = _regex_classe(tag_class)
+        self._content_probe = re.compile(_TAG_CLASSE.format(tag=re.escape(tag_name)), re.IGNORECASE)
+        self._strainer = SoupStrainer(tag_name, class_=self._classe)
+
     def can_parse(self, content: Any) -> bool:
         """Vérifie si le contenu contient une wikitable"""
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
+        if isinstance(content, BeautifulSoup):
             tag_name, tag_class = self.config.content_tags
-            return soup.find(tag_name, class_=tag_class) is not None
-        except:
-            return False
+            return content.find(tag_name, class_=tag_class) is not None
+        if isinstance(content, str):
+            # Sonde textuelle : évite de parser le HTML pour la détection
+            for m in self._content_probe.finditer(content):
+                if self._classe.search(m.group('dq') or m.group('sq') or m.group('nq') or ''):
+                    return True
+        return False
 
     def parse_content(self, summary: Any, src: str, artRGPD: List[str]) -> Optional[DecisionData]:
         """Parse un tableau Wikitable"""
         try:
-            soup = BeautifulSoup(summary, 'html.parser')
+            soup = self._as_soup(summary, self._strainer)
             tag_name, tag_class = self.config.content_tags
             table = soup.find(tag_name, class_=tag_class)
 
@@ -318,22 +438,22 @@ class WikitableParser(Parser):
 
             decision = DecisionData()
 
-            # Parcourir la table
+            # Parcourir la table (cellules directes de chaque ligne, sans descendre dans leur contenu)
+            key_mapping = self.config.key_mapping
             for row in table.find_all('tr'):
-                cells = row.find_all(['th', 'td'])
+                cells = row.find_all(('th', 'td'), recursive=False)
                 if len(cells) == 2:
                     # Nettoyer la clé
-                    key = cells[0].get_text(strip=True).replace(':', '')
-                    value = cells[1].get_text(strip=True)
+                    key = _cell_text(cells[0]).rstrip(':')
+                    value = _cell_text(cells[1])
 
                     # Mapper vers DecisionData
-                    if key in self.config.key_mapping:
-                        attribute_name = self.config.key_mapping[key]
+                    attribute_name = key_mapping.get(key)
+                    if attribute_name is not None:
                         setattr(decision, attribute_name, value)
 
-            # Ajouter les griefs
-            if artRGPD:
-                decision.griefs = ', '.join([f'"{grief}"' for grief in artRGPD])
+            # Ajouter les griefs (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Ajouter la source
             if src:
@@ -348,10 +468,10 @@ class WikitableParser(Parser):
             logger.error(f"❗ Erreur parsing Wikitable: {e}")
             return None
 
-    def extract_references(self, summary_html: str) -> List[str]:
-        """Extrait les articles RGPD depuis le tableau HTML"""
+    def extract_references(self, summary_html: Any) -> List[str]:
+        """Extrait les articles RGPD depuis le tableau HTML (chaîne ou soupe déjà parsée)"""
         try:
-            soup = BeautifulSoup(summary_html, 'html.parser')
+            soup = self._as_soup(summary_html, self._strainer)
             tag_name, tag_class = self.config.reference_tags
             table = soup.find(tag_name, class_=tag_class)
 
@@ -366,8 +486,8 @@ class WikitableParser(Parser):
                 articles_cell = relevant_law_header.find_next_sibling(['td', 'th'])
                 if articles_cell:
                     for link in articles_cell.find_all('a'):
-                        article_text = link.get_text(strip=True)
-                        article_modifie = article_text.replace(" GDPR", "RGPD").replace("Article ", "").replace(" ", "")
+                        article_text = _cell_text(link)
+                        article_modifie = _ARTICLE_SUB.sub(lambda m: _ARTICLE_MAP[m.group(0)], article_text)
                         if article_modifie:
                             articles_rgpd.append(article_modifie)
 
@@ -381,16 +501,15 @@ class WikitableParser(Parser):
 class WikicodeParser(Parser):
     """Parser pour le wikicode (format texte)"""
 
+    griefs_entre_guillemets = False
+
     def can_parse(self, content: Any) -> bool:
         """Vérifie si le contenu est du wikicode"""
         if not isinstance(content, str):
             return False
 
         # Cherche les box types
-        for box_type in self.config.box_mappings.keys():
-            if box_type in content:
-                return True
-        return False
+        return self.config.box_type_pattern.search(content) is not None
 
     def parse_content(self, summary: Any, src: str, artRGPD: List[str]) -> Optional[DecisionData]:
         """Parse le wikicode"""
@@ -398,9 +517,9 @@ class WikicodeParser(Parser):
             # Identifier le type de box
             box_dict = None
             box_type = None
-            for bt in self.config.box_mappings.keys():
+            for bt, mapping in self.config.box_mappings.items():
                 if bt in summary:
-                    box_dict = self.config.box_mappings[bt]
+                    box_dict = mapping
                     box_type = bt
                     break
 
@@ -410,22 +529,20 @@ class WikicodeParser(Parser):
             decision = DecisionData()
 
             # Extraire avec regex
-            pattern = re.compile(self.config.regex_patterns['field_pattern'])
-            matches = pattern.findall(summary)
+            matches = self.config.compiled_patterns['field_pattern'].findall(summary)
 
             for key, value in matches:
                 adjusted_key = key.strip()
-                if adjusted_key in box_dict:
-                    attr_name = box_dict[adjusted_key]
+                attr_name = box_dict.get(adjusted_key)
+                if attr_name is not None:
                     setattr(decision, attr_name, value.strip().replace('\n', ' ').strip())
 
             # Cas spécial CJUE
             if box_type == 'CJEUdecisionBOX' and (not decision.juridiction or decision.juridiction == ""):
                 decision.juridiction = 'CJUE'
 
-            # Ajouter les griefs
-            if artRGPD:
-                decision.griefs = ', '.join(artRGPD)
+            # Ajouter les griefs (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Ajouter la source
             if src:
@@ -443,12 +560,11 @@ class WikicodeParser(Parser):
     def extract_references(self, summary_html: str) -> List[str]:
         """Extrait les articles RGPD du wikicode"""
         try:
-            pattern = self.config.regex_patterns['article_pattern']
-            matches = re.findall(pattern, summary_html)
+            matches = self.config.compiled_patterns['article_pattern'].findall(summary_html)
 
             articles_rgpd = []
             for match in matches:
-                article_modifie = match.replace("GDPR", "RGPD").replace(" ", "").replace("Article", "")
+                article_modifie = _ARTICLE_WIKICODE_SUB.sub(lambda m: _ARTICLE_WIKICODE_MAP[m.group(0)], match)
                 if article_modifie:
                     articles_rgpd.append(article_modifie)
 
@@ -472,19 +588,18 @@ class ProseParser(Parser):
             decision = DecisionData()
 
             # Extraction avec regex
-            if 'fine' in self.config.regex_patterns:
-                fine_match = re.search(self.config.regex_patterns['fine'], summary)
+            if 'fine' in self.config.compiled_patterns:
+                fine_match = self.config.compiled_patterns['fine'].search(summary)
                 if fine_match:
                     decision.quantum = fine_match.group(1)
 
-            if 'date' in self.config.regex_patterns:
-                date_match = re.search(self.config.regex_patterns['date'], summary)
+            if 'date' in self.config.compiled_patterns:
+                date_match = self.config.compiled_patterns['date'].search(summary)
                 if date_match:
                     decision.date = date_match.group(1)
 
-            # Ajouter les griefs
-            if artRGPD:
-                decision.griefs = ', '.join([f'"{grief}"' for grief in artRGPD])
+            # Ajouter les griefs (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Ajouter la source
             if src:
@@ -519,46 +634,79 @@ class ParserFactory:
             ProseParser(ProseParserConfig())
         ]
 
-    def get_parser(self, content: Any) -> Optional[Parser]:
+    def get_parser(self, content: Any, summary_soup: Optional[BeautifulSoup] = None) -> Optional[Parser]:
         """
         Sélectionne automatiquement le bon parser selon le contenu.
         Essaie chaque parser dans l'ordre jusqu'à trouver un match.
+        La soupe éventuellement fournie est testée par les parsers qui l'acceptent.
         """
         for parser in self.parsers:
-            if parser.can_parse(content):
+            if parser.can_parse(self._contenu_pour(parser, content, summary_soup)):
                 logger.info(f"💡 Parser sélectionné: {parser.config.name}")
                 return parser
 
         logger.warning("⚠️ Aucun parser approprié trouvé")
         return None
 
-    def parse_with_auto_detection(self, summary: Any, src: str = "", artRGPD: List[str] = None) -> Optional[DecisionData]:
+    @staticmethod
+    def _contenu_pour(parser: Parser, summary: Any, summary_soup: Optional[BeautifulSoup]) -> Any:
+        """Transmet la soupe déjà parsée aux parsers qui l'acceptent, sinon le contenu brut"""
+        if summary_soup is not None and parser.accepte_soupe:
+            return summary_soup
+        return summary
+
+    def parse_with_auto_detection(self, summary: Any, src: str = "", artRGPD: List[str] = None,
+                                  summary_soup: Optional[BeautifulSoup] = None) -> Optional[DecisionData]:
         """
         Parse automatiquement avec détection du bon parser.
 
         :param summary: Contenu à parser
         :param src: URL source
         :param artRGPD: Liste des articles RGPD
+        :param summary_soup: Soupe BS4 déjà construite pour ce contenu (facultatif)
         :return: DecisionData ou None
         """
-        parser = self.get_parser(summary)
+        parser = self.get_parser(summary, summary_soup)
         if parser:
-            return parser.parse_content(summary, src, artRGPD or [])
+            return parser.parse_content(self._contenu_pour(parser, summary, summary_soup), src, artRGPD or [])
         return None
 
-    def extract_references_auto(self, summary: Any) -> List[str]:
+    def parse_and_extract(self, summary: Any, src: str = "",
+                          summary_soup: Optional[BeautifulSoup] = None) -> Tuple[Optional[DecisionData], List[str]]:
+        """
+        Détecte le parser une seule fois, puis extrait les références et parse le contenu.
+
+        :param summary: Contenu à parser
+        :param src: URL source
+        :param summary_soup: Soupe BS4 déjà construite pour ce contenu (facultatif)
+        :return: (DecisionData ou None, liste des références RGPD)
+        """
+        parser = self.get_parser(summary, summary_soup)
+        if not parser:
+            return None, []
+
+        contenu = self._contenu_pour(parser, summary, summary_soup)
+        artRGPD = parser.extract_references(contenu)
+        return parser.parse_content(contenu, src, artRGPD), artRGPD
+
+    def extract_references_auto(self, summary: Any, summary_soup: Optional[BeautifulSoup] = None) -> List[str]:
         """
         Extrait les références avec auto-détection du parser.
 
         :param summary: Contenu à parser
+        :param summary_soup: Soupe BS4 déjà construite pour ce contenu (facultatif)
         :return: Liste des références RGPD
         """
-        parser = self.get_parser(summary)
+        parser = self.get_parser(summary, summary_soup)
         if parser:
-            return parser.extract_references(summary)
+            return parser.extract_references(self._contenu_pour(parser, summary, summary_soup))
         return []
 
 
+# Factory partagée : parsers et configurations construits une seule fois
+_FACTORY = ParserFactory()
+
+
 # ============================================================================
 # FONCTIONS UTILITAIRES
 # ============================================================================
@@ -571,8 +719,8 @@ def convertir_date_format_iso(date_string: str) -> str:
     :return: string date au format ISO
     '''
     try:
-        date_obj = datetime.strptime(date_string, '%d.%m.%Y')
-        return date_obj.strftime('%Y-%m-%d')
+        jour, mois, annee = date_string.split('.')
+        return date(int(annee), int(mois), int(jour)).isoformat()
     except ValueError:
         return "Format de date invalide"
 
@@ -584,7 +732,7 @@ def fdate(dateISO: str) -> str:
     :param dateISO: string contenant une date au format ISO
     :return: string contenant une date au format d MMMM YYYY
     '''
-    date_obj = datetime.fromisoformat(dateISO)
+    date_obj = date(*map(int, dateISO.split('-')))
     day = date_obj.day
     month = date_obj.strftime('%B')
     year = date_obj.year
@@ -598,6 +746,20 @@ def fdate(dateISO: str) -> str:
     return formatted_date
 
 
+@lru_cache(maxsize=512)
+def _format_griefs(griefs: Tuple[str, ...], guillemets: bool = True) -> str:
+    '''
+    Mise en forme de la liste des griefs, mémoïsée (mêmes articles d'une décision à l'autre)
+
+    :param griefs: Tuple[str, ...] - articles RGPD
+    :param guillemets: bool - articles entourés de guillemets
+    :return: str - griefs séparés par des virgules
+    '''
+    if guillemets:
+        return ', '.join(map('"{}"'.format, griefs))
+    return ', '.join(griefs)
+
+
 def est_traitée(identifiant: str) -> bool:
     '''
     Méthode vérifiant si ID déjà traité
@@ -609,20 +771,41 @@ def est_traitée(identifiant: str) -> bool:
     return identifiant in entrées_traitées
 
 
+def charger_entrées_traitées() -> set:
+    '''
+    Méthode chargeant le fichier de suivi (JSONL, un identifiant par ligne).
+    Un ancien fichier au format liste JSON est converti une seule fois en JSONL.
+
+    :return: set - identifiants déjà traités
+    '''
+    with open(suivi_fichier, 'r') as fichier:
+        contenu = fichier.read()
+
+    if contenu.lstrip().startswith('['):
+        identifiants = json.loads(contenu)
+        with open(suivi_fichier, 'w') as fichier:
+            fichier.writelines(json.dumps(identifiant) + '\n' for identifiant in identifiants)
+        logger.info(f"💡 Fichier de suivi converti en JSONL: {suivi_fichier}")
+        return set(identifiants)
+
+    return {json.loads(ligne) for ligne in contenu.splitlines() if ligne.strip()}
+
+
 def ajouter_entrée_traitée(identifiant: str) -> bool:
     '''
-    Méthode ajoutant une entrée au fichier de suivi
+    Méthode ajoutant une entrée au fichier de suivi (ajout d'une ligne en fin de fichier)
 
     :param identifiant: str - identifiant de la décision vérifiée
     :return: bool - True si tout s'est bien passé
     '''
-    entrées_traitées.append(identifiant)
     try:
-        with open(suivi_fichier, 'w') as fichier:
-            json.dump(entrées_traitées, fichier)
-            return True
+        with _SUIVI_LOCK:
+            entrées_traitées.add(identifiant)
+            with open(suivi_fichier, 'a') as fichier:
+                fichier.write(json.dumps(identifiant) + '\n')
+        return True
     except Exception as e:
-        logger.error(f"❗ Erreur à l'ajout de {identifiant} dans le JSON: {e}")
+        logger.error(f"❗ Erreur à l'ajout de {identifiant} dans le JSONL: {e}")
         return False
 
 
@@ -647,41 +830,140 @@ def extract_url_src(summary_soup: BeautifulSoup) -> str:
     return ""
 
 
-def formatgdprBox(contenu: DecisionData) -> str:
-    '''
-    Mise en forme des éléments extraits de GDPRHub sous forme de texte
-
-    :param contenu: DecisionData contenant les éléments de la décision
-    :return: Texte formaté en Markdown
-    '''
-    md_content = f"""---
+# Gabarit Markdown des fiches (structure statique, complété via format_map)
+_MD_TEMPLATE = """---
 aliases: []
-creation: {contenu.date_actuelle}
-griefs: [{contenu.griefs}]
-pays: {contenu.pays}
-juridiction: {contenu.apd_traduite or contenu.juridiction}
-date: {contenu.date_convertie}
-type: {contenu.type}
-sanction: {contenu.outcome}
-quantum: {contenu.quantum}
+creation: {c.date_actuelle}
+griefs: [{c.griefs}]
+pays: {c.pays}
+juridiction: {juridiction}
+date: {c.date_convertie}
+type: {c.type}
+sanction: {c.outcome}
+quantum: {c.quantum}
 domaine: []
 sanctionCtr: []
-champ: {contenu.champ}
+champ: {c.champ}
 ---
 **Liens**:
-**Autorité**: {contenu.juridiction}
-**Sources**: [GDPRHub]({contenu.id}) ; [Original]({contenu.URLsrc})
+**Autorité**: {c.juridiction}
+**Sources**: [GDPRHub]({c.id}) ; [Original]({c.URLsrc})
 
 ---
 ```
-{translateAcronyme(contenu.juridiction)}, {contenu.date_titre}, {contenu.nom}n° {contenu.numero}
+{juridAcro}, {c.date_titre}, {c.nom}n° {c.numero}
 ```
 ---
 #AI_intégrer
 
-{contenu.texte_FR}
+{c.texte_FR}
 """
-    return md_content
+
+
+def formatgdprBox(contenu: DecisionData) -> str:
+    '''
+    Mise en forme des éléments extraits de GDPRHub sous forme de texte
+
+    :param contenu: DecisionData contenant les éléments de la décision
+    :return: Texte formaté en Markdown
+    '''
+    return _MD_TEMPLATE.format_map({
+        'c': contenu,
+        'juridiction': contenu.apd_traduite or contenu.juridiction,
+        'juridAcro': contenu.juridAcro or _cached_translateAcronyme(contenu.juridiction),
+    })
+
+
+def deeplTrans_batch(texts: List[str]) -> List[str]:
+    '''
+    Traduction d'une liste de textes en un seul lot.
+    Les doublons ne sont traduits qu'une fois et les appels deeplTrans sont
+    faits en parallèle ; l'ordre de la liste d'entrée est conservé.
+
+    :param texts: List[str] - textes à traduire
+    :return: List[str] - textes traduits, dans le même ordre
+    '''
+    uniques = list(dict.fromkeys(texts))
+    if not uniques:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(uniques))) as executor:
+        traductions = dict(zip(uniques, executor.map(deeplTrans, uniques)))
+
+    return [traductions[t] for t in texts]
+
+
+def _collect_section(span, titres: Tuple[str, ...] = ('h3',), arret: Optional[str] = None) -> str:
+    '''
+    Collecte le texte des éléments suivant le titre d'une section, jusqu'au titre suivant
+
+    :param span: Tag | None - <span id=...> du titre de section
+    :param titres: Tuple[str, ...] - balises de titre parentes acceptées
+    :param arret: str | None - texte marquant la fin de la section
+    :return: str - contenu de la section, un élément par ligne
+    '''
+    if span is None:
+        return ""
+    parent_heading = span.find_parent(titres)
+    if parent_heading is None:
+        return ""
+
+    contenu = []
+    for sibling in parent_heading.find_next_siblings():
+        if arret and arret in sibling.get_text():
+            break
+        if sibling.name.startswith('h'):
+            break
+        contenu.append(' '.join(sibling.stripped_strings) + '\n')
+    return ''.join(contenu)
+
+
+def _process_entry(entry_id: str, summary_html: str, factory: 'ParserFactory') -> Tuple[DecisionData, str]:
+    '''
+    Traitement d'une entrée du flux : parsing du sommaire et extraction des sections
+    (la traduction est faite ensuite, par lot, dans lire_flux_BS4)
+
+    :param entry_id: str - identifiant de l'entrée
+    :param summary_html: str - sommaire HTML de l'entrée
+    :param factory: ParserFactory - factory de parsers partagée
+    :return: Tuple[DecisionData, str] - données de la décision et texte à traduire
+    '''
+    # Soupe complète : le texte des sections peut se trouver dans n'importe quel bloc (dl, blockquote, div, pre...)
+    summary_soup = BeautifulSoup(summary_html, 'lxml')
+
+    # Utilisation de la factory pour auto-détection
+    src = extract_url_src(summary_soup)
+
+    # Auto-détection unique du parser, puis références et parsing
+    decision_data, artRGPD = factory.parse_and_extract(
+        summary=summary_html,
+        src=src,
+        summary_soup=summary_soup
+    )
+
+    if not decision_data:
+        logger.warning(f"\n⚠️ Boxdata vide pour: {entry_id}\n")
+        decision_data = DecisionData()
+        decision_data.id = entry_id
+        decision_data.griefs = 'Erreur'
+        decision_data.proposed_filename = time.strftime(f"GDPRHub-%Y%m%d%H%M%S")
+
+    # Extraction des sections Facts, Holding, Comment (une seule recherche dans l'arbre)
+    sections = {}
+    for span in summary_soup.find_all('span', id=_SECTIONS_IDS):
+        sections.setdefault(span.get('id'), span)
+
+    facts_content = _collect_section(sections.get('Facts'))
+    holding_content = _collect_section(sections.get('Holding'))
+    cmtr_content = _collect_section(sections.get('Comment'), titres=('h2', 'h3'),
+                                    arret='Share your comments here!')
+
+    txt = '\n'.join([facts_content, "# Décision", holding_content, "# Commentaire", cmtr_content])
+
+    decision_data.id = entry_id
+    decision_data.rss = True
+
+    return decision_data, txt
 
 
 def lire_flux_BS4(url: str, test_mode: bool = False) -> List[DecisionData]:
@@ -692,87 +974,40 @@ def lire_flux_BS4(url: str, test_mode: bool = False) -> List[DecisionData]:
     :param test_mode: bool - Mode test
     :return: list[DecisionData] - liste d'articles
     '''
-    user_agent = defUserAgent()
-    headers = {"User-Agent": user_agent}
+    response = _SESSION.get(url, stream=False)
+
+    # Factory partagée (construite au chargement du module)
+    factory = _FACTORY
+
+    # Lecture en flux des <entry> (fast-iter lxml : chaque élément est libéré après lecture).
+    # Court-circuit avant soumission : pas de travail pour les entrées déjà vues
+    a_traiter = []
+    nb_entrees = 0
+    for _, entry in etree.iterparse(BytesIO(response.content), tag=_ATOM_ENTRY):
+        nb_entrees += 1
+        entry_id = entry.findtext(_ATOM_ID, '')
+        if test_mode or not est_traitée(entry_id):
+            a_traiter.append((entry_id, entry.findtext(_ATOM_SUMMARY, '')))
+        else:
+            logger.info(f"💡 Déjà traité: {entry_id}")
 
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'xml')
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
 
-    entries = soup.find_all('entry')
     if test_mode:
-        logger.debug(f"🔍🛠️ Nombre d'entrées trouvées: {len(entries)}")
+        logger.debug(f"🔍🛠️ Nombre d'entrées trouvées: {nb_entrees}")
 
-    # Créer la factory
-    factory = ParserFactory()
+    # 1re passe : parsing parallèle, résultats conservés dans l'ordre du flux
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        resultats = list(executor.map(lambda entree: _process_entry(*entree, factory), a_traiter))
 
-    articles = []
+    articles = [decision_data for decision_data, _ in resultats]
 
-    for entry in entries:
-        entry_id = entry.find('id').text
-        summary_html = entry.find('summary').text
-        summary_soup = BeautifulSoup(summary_html, 'html.parser')
-
-        if test_mode or not est_traitée(entry_id):
-            # Utilisation de la factory pour auto-détection
-            artRGPD = factory.extract_references_auto(summary_html)
-            src = extract_url_src(summary_soup)
-
-            # Parsing avec auto-détection
-            decision_data = factory.parse_with_auto_detection(
-                summary=summary_html,
-                src=src,
-                artRGPD=artRGPD
-            )
-
-            if not decision_data:
-                logger.warning(f"\n⚠️ Boxdata vide pour: {entry_id}\n")
-                decision_data = DecisionData()
-                decision_data.id = entry_id
-                decision_data.griefs = 'Erreur'
-                decision_data.proposed_filename = time.strftime(f"GDPRHub-%Y%m%d%H%M%S")
-
-            # Extraction des sections Facts, Holding, Comment
-            facts_heading = summary_soup.find('span', id='Facts')
-            facts_content = ""
-            if facts_heading:
-                for sibling in facts_heading.find_parent('h3').find_next_siblings():
-                    if sibling.name.startswith('h'):
-                        break
-                    if hasattr(sibling, 'text'):
-                        facts_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            holding_heading = summary_soup.find('span', id="Holding")
-            holding_content = ""
-            if holding_heading:
-                for sibling in holding_heading.find_parent('h3').find_next_siblings():
-                    if sibling.name.startswith('h'):
-                        break
-                    if hasattr(sibling, 'text'):
-                        holding_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            cmtr_heading = summary_soup.find('span', id="Comment")
-            cmtr_content = ""
-            if cmtr_heading:
-                parent_heading = cmtr_heading.find_parent(['h2', 'h3'])
-                if parent_heading:
-                    for sibling in parent_heading.find_next_siblings():
-                        if 'Share your comments here!' in sibling.get_text():
-                            break
-                        if sibling.name.startswith('h'):
-                            break
-                        if hasattr(sibling, 'text'):
-                            cmtr_content += sibling.get_text(separator=' ', strip=True) + '\n'
-
-            txt = '\n'.join([facts_content, "# Décision", holding_content, "# Commentaire", cmtr_content])
-            txt_FR = deeplTrans(txt)
-
-            decision_data.id = entry_id
-            decision_data.texte_FR = txt_FR
-            decision_data.rss = True
-
-            articles.append(decision_data)
-        else:
-            logger.info(f"💡 Déjà traité: {entry_id}")
+    # 2e passe : traduction de tous les textes en un seul lot
+    textes_FR = deeplTrans_batch([txt for _, txt in resultats])
+    for decision_data, txt_FR in zip(articles, textes_FR):
+        decision_data.texte_FR = txt_FR
 
     return articles
 
@@ -784,21 +1019,21 @@ def run(test_mode: bool = False) -> None:
     :param test_mode: bool - [TEST MODE] activé
     :return: aucun retour attendu
     '''
-    global entrées_traitées
+    global entrées_traitées, _DATE_ACTUELLE
 
     print('\n\n\n\t\t*** RSS GDPRHub (Refactored) ***\n')
+    _DATE_ACTUELLE = dateActuelle()
     cabKM = settings.cab_km_dir
     rss_url = settings.Feeds.GDPRHub
 
     if os.path.exists(suivi_fichier) and not test_mode:
         try:
-            with open(suivi_fichier, 'r') as fichier:
-                entrées_traitées = json.load(fichier)
+            entrées_traitées = charger_entrées_traitées()
         except Exception as e:
-            logger.error(f"❗ Erreur lors du chargement du JSON: {e}")
-            entrées_traitées = []
+            logger.error(f"❗ Erreur lors du chargement du suivi: {e}")
+            entrées_traitées = set()
     else:
-        entrées_traitées = []
+        entrées_traitées = set()
 
     articles = lire_flux_BS4(rss_url, True)
     if test_mode:
@@ -7,26 +7,43 @@ Illustre comment créer une configuration et un parser personnalisés
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from bs4 import BeautifulSoup
+from lxml import etree
 import re
 
 # Import depuis le fichier refactoré
 from gdprhubRSS_refactored import ParserConfig, Parser, DecisionData, logger
 
+# Nettoyage des libellés d'articles en une seule passe
+_ARTICLE_CLEAN = re.compile(r'Article |GDPR')
+_ARTICLE_CLEAN_MAP = {'Article ': '', 'GDPR': 'RGPD'}
+
+# Séparateurs retirés des montants (espaces, virgules, espaces insécables)
+_QUANTUM_STRIP = str.maketrans('', '', ' ,\u00a0')
+
+
+def _article_clean_repl(m: re.Match) -> str:
+    """Remplacement associé à _ARTICLE_CLEAN"""
+    return _ARTICLE_CLEAN_MAP[m.group(0)]
+
 
 # ============================================================================
 # EXEMPLE 1 : Parser pour un site avec structure JSON
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class JSONSiteParserConfig(ParserConfig):
     """Configuration pour parser un site retournant du JSON"""
 
+    # Mapping JSON → DecisionData (renseigné dans __post_init__)
+    json_mapping: Dict[str, str] = field(default_factory=dict)
+
     def __post_init__(self):
         self.name = "JSONSite"
         # Pas de tags HTML pour JSON
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
         # Mapping JSON → DecisionData
         self.json_mapping = {
@@ -59,9 +76,8 @@ class JSONSiteParser(Parser):
                 if json_key in summary:
                     setattr(decision, attr_name, summary[json_key])
 
-            # Articles RGPD
-            if artRGPD:
-                decision.griefs = ', '.join([f'"{grief}"' for grief in artRGPD])
+            # Articles RGPD (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Source
             if src:
@@ -87,7 +103,7 @@ class JSONSiteParser(Parser):
 # EXEMPLE 2 : Parser pour un site avec structure table custom
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CustomTableParserConfig(ParserConfig):
     """Configuration pour un site avec des tables HTML personnalisées"""
 
@@ -97,7 +113,7 @@ class CustomTableParserConfig(ParserConfig):
         self.content_tags = ("div", "decision-container")
         self.reference_tags = ("ul", "article-list")
         self.source_tags = ("a", "external-link")
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
     def _default_key_mapping(self) -> Dict[str, str]:
         """Mapping spécifique au site"""
@@ -112,44 +128,105 @@ class CustomTableParserConfig(ParserConfig):
         }
 
 
+def _node_text(node) -> str:
+    """Texte d'un élément lxml, équivalent à get_text(strip=True) de BS4"""
+    return ''.join(t.strip() for t in node.itertext())
+
+
+def _a_la_classe(elem, tag_class: str) -> bool:
+    """Vérifie si l'élément porte la classe CSS donnée"""
+    return tag_class in (elem.get('class') or '').split()
+
+
+# Parseur HTML lxml partagé (documents UTF-8)
+_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+
+@lru_cache(maxsize=8)
+def _arbre_html(content: Any):
+    """
+    Arbre lxml du HTML, mémoïsé par contenu : can_parse, parse_content et extract_references
+    d'un même sommaire partagent un seul parsing.
+
+    :param content: str | bytes - contenu HTML
+    :return: arbre lxml, ou None si le document est vide
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return etree.fromstring(content, _HTML_PARSER)
+
+
+def _premier_conteneur(content: Any, tags: Tuple[str, str]):
+    """
+    Premier élément (tag, classe) du HTML, dans l'ordre du document.
+
+    :param content: str | bytes | BeautifulSoup - contenu HTML
+    :param tags: Tuple[str, str] - (tag, classe CSS) recherchés
+    :return: élément lxml trouvé, ou None
+    """
+    if not isinstance(content, (str, bytes)):
+        # Soupe passée directement par l'appelant
+        content = str(content)
+
+    arbre = _arbre_html(content)
+    if arbre is None:
+        return None
+
+    tag_name, tag_class = tags
+    for elem in arbre.iter(tag_name):
+        if _a_la_classe(elem, tag_class):
+            return elem
+    return None
+
+
 class CustomTableParser(Parser):
-    """Parser pour tables HTML personnalisées"""
+    """Parser pour tables HTML personnalisées (arbre lxml du HTML brut, construit une fois par sommaire)"""
 
     def can_parse(self, content: Any) -> bool:
         """Détecte la structure spécifique"""
+        # Seuls le HTML brut et une soupe déjà parsée sont acceptés
+        if not isinstance(content, (str, bytes, BeautifulSoup)):
+            return False
+
+        tag_name, tag_class = self.config.content_tags
+        # Test de sous-chaîne avant tout parsing HTML
+        if isinstance(content, str) and tag_class not in content:
+            return False
+        if isinstance(content, bytes) and tag_class.encode() not in content:
+            return False
+
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            tag_name, tag_class = self.config.content_tags
-            return soup.find(tag_name, class_=tag_class) is not None
-        except:
+            # Soupe transmise par la factory : recherche directe ; sinon arbre lxml mémoïsé
+            if isinstance(content, BeautifulSoup):
+                return content.find(tag_name, class_=tag_class) is not None
+            return _premier_conteneur(content, self.config.content_tags) is not None
+        except Exception:
             return False
 
     def parse_content(self, summary: Any, src: str, artRGPD: List[str]) -> Optional[DecisionData]:
-        """Parse la table custom"""
+        """Parse la table custom (arbre lxml partagé avec can_parse)"""
         try:
-            soup = BeautifulSoup(summary, 'html.parser')
-            tag_name, tag_class = self.config.content_tags
-            container = soup.find(tag_name, class_=tag_class)
+            # Conteneur cherché dans l'arbre déjà construit par can_parse
+            container = _premier_conteneur(summary, self.config.content_tags)
 
-            if not container:
+            if container is None:
                 return None
 
             decision = DecisionData()
 
-            # Extraction via les <dt><dd> pairs
-            for dt in container.find_all('dt'):
-                dd = dt.find_next_sibling('dd')
-                if dd:
-                    key = dt.get_text(strip=True)
-                    value = dd.get_text(strip=True)
+            # Extraction via les paires <dt><dd> (dd suivant chaque dt)
+            # Références locales hors de la boucle
+            mapping_get = self.config.key_mapping.get
+            texte = _node_text
+            for dt in container.iter('dt'):
+                dd = next(dt.itersiblings('dd'), None)
+                if dd is not None:
+                    attr_name = mapping_get(texte(dt))
+                    if attr_name is not None:
+                        setattr(decision, attr_name, texte(dd))
 
-                    if key in self.config.key_mapping:
-                        attr_name = self.config.key_mapping[key]
-                        setattr(decision, attr_name, value)
-
-            # Articles RGPD
-            if artRGPD:
-                decision.griefs = ', '.join([f'"{grief}"' for grief in artRGPD])
+            # Articles RGPD (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Source
             if src:
@@ -167,20 +244,20 @@ class CustomTableParser(Parser):
     def extract_references(self, summary: Any) -> List[str]:
         """Extrait les articles RGPD depuis une liste <ul>"""
         try:
-            soup = BeautifulSoup(summary, 'html.parser')
-            tag_name, tag_class = self.config.reference_tags
-            ul = soup.find(tag_name, class_=tag_class)
+            ul = _premier_conteneur(summary, self.config.reference_tags)
 
-            if not ul:
+            if ul is None:
                 return []
 
+            # Références locales hors de la boucle
+            nettoyer = _ARTICLE_CLEAN.sub
             articles = []
-            for li in ul.find_all('li'):
-                article_text = li.get_text(strip=True)
+            ajouter = articles.append
+            for li in ul.iter('li'):
                 # Nettoyer et formater
-                article = article_text.replace("Article ", "").replace("GDPR", "RGPD")
+                article = nettoyer(_article_clean_repl, _node_text(li))
                 if article:
-                    articles.append(article)
+                    ajouter(article)
 
             return articles
 
@@ -193,22 +270,31 @@ class CustomTableParser(Parser):
 # EXEMPLE 3 : Parser avec regex complexes pour un format texte spécifique
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ComplexTextParserConfig(ParserConfig):
     """Configuration pour un format texte avec patterns complexes"""
 
+    # Littéral obligatoire de l'en-tête, testé avant la regex dans can_parse
+    header_marker: str = 'DECISION'
+
+    # Sonde d'en-tête : le format commence par "DECISION N°", seul le début du texte est examiné
+    probe_pattern: re.Pattern = re.compile(r'^\s{0,20}(?=DECISION\s+N°)', re.MULTILINE)
+    probe_window: int = 256
+
     def __post_init__(self):
         self.name = "ComplexText"
-        super().__post_init__()
+        ParserConfig.__post_init__(self)
 
         # Patterns regex avancés
         self.regex_patterns = {
             'decision_header': r'DECISION\s+N°\s*(\S+)\s+DU\s+(\d{2}/\d{2}/\d{4})',
             'authority': r'Autorité\s*:\s*([^\n]+)',
             'fine': r'Montant\s*:\s*€?\s*([\d\s,]+)',
-            'articles': r'Articles?\s+(\d+(?:\.\d+)?(?:[a-z])?(?:\s*et\s*\d+(?:\.\d+)?(?:[a-z])?)*)',
+            # Quantificateurs possessifs (Python 3.11+) : pas de retour arrière sur les répétitions imbriquées
+            'articles': r'Articles?\s++(\d++(?:\.\d++)?+(?:[a-z])?+(?:\s*+et\s*+\d++(?:\.\d++)?+(?:[a-z])?+)*+)',
             'parties': r'Parties?\s*:\s*([^\n]+)'
         }
+        self.compile_patterns()
 
 
 class ComplexTextParser(Parser):
@@ -218,38 +304,49 @@ class ComplexTextParser(Parser):
         """Détecte le format via pattern signature"""
         if not isinstance(content, str):
             return False
-        pattern = self.config.regex_patterns.get('decision_header', '')
-        return bool(re.search(pattern, content))
+        config = self.config
+        # Test de sous-chaîne puis sonde, bornés au début du texte
+        if content.find(config.header_marker, 0, config.probe_window) < 0:
+            return False
+        probe = config.probe_pattern.search(content, 0, config.probe_window)
+        if probe is None:
+            return False
+        # En-tête complet (numéro et date) vérifié à la position trouvée
+        pattern = config.compiled_patterns.get('decision_header')
+        return pattern is not None and pattern.match(content, probe.end()) is not None
 
     def parse_content(self, summary: Any, src: str, artRGPD: List[str]) -> Optional[DecisionData]:
         """Parse avec regex"""
         try:
             decision = DecisionData()
 
+            # Une recherche précompilée par champ : chaque motif garde son préfixe littéral,
+            # que le moteur re localise bien plus vite qu'une alternation parcourue caractère par caractère
+            patterns = self.config.compiled_patterns
+
             # Extraction numéro et date
-            header_match = re.search(self.config.regex_patterns['decision_header'], summary)
+            header_match = patterns['decision_header'].search(summary)
             if header_match:
                 decision.numero = header_match.group(1)
                 decision.date = header_match.group(2)
 
             # Extraction autorité
-            auth_match = re.search(self.config.regex_patterns['authority'], summary)
+            auth_match = patterns['authority'].search(summary)
             if auth_match:
                 decision.juridiction = auth_match.group(1).strip()
 
             # Extraction amende
-            fine_match = re.search(self.config.regex_patterns['fine'], summary)
+            fine_match = patterns['fine'].search(summary)
             if fine_match:
-                decision.quantum = fine_match.group(1).replace(' ', '').replace(',', '')
+                decision.quantum = fine_match.group(1).translate(_QUANTUM_STRIP)
 
             # Extraction parties
-            parties_match = re.search(self.config.regex_patterns['parties'], summary)
+            parties_match = patterns['parties'].search(summary)
             if parties_match:
                 decision.nom = parties_match.group(1).strip()
 
-            # Articles RGPD
-            if artRGPD:
-                decision.griefs = ', '.join([f'"{grief}"' for grief in artRGPD])
+            # Articles RGPD (formatés au post-traitement)
+            decision.griefs_raw = artRGPD
 
             # Source
             if src:
@@ -267,16 +364,14 @@ class ComplexTextParser(Parser):
     def extract_references(self, summary: Any) -> List[str]:
         """Extrait les articles avec regex"""
         try:
-            pattern = self.config.regex_patterns.get('articles', '')
-            matches = re.findall(pattern, summary)
+            pattern = self.config.compiled_patterns.get('articles')
+            matches = pattern.findall(summary) if pattern is not None else []
 
             articles = []
             for match in matches:
-                # Séparer les articles multiples (ex: "5 et 6")
-                parts = re.split(r'\s+et\s+', match)
-                for part in parts:
-                    article = f"RGPD{part.strip()}"
-                    articles.append(article)
+                # Séparer les articles multiples (ex: "5 et 6") : espaces normalisés puis split littéral
+                parts = ' '.join(match.split()).split(' et ')
+                articles.extend([f"RGPD{part.strip()}" for part in parts])
 
             return articles
 
@@ -303,6 +398,53 @@ def demo_custom_parsers():
             self.parsers.insert(0, JSONSiteParser(JSONSiteParserConfig()))
             self.parsers.insert(1, CustomTableParser(CustomTableParserConfig()))
             self.parsers.insert(2, ComplexTextParser(ComplexTextParserConfig()))
+            # Dispatch direct par type : le JSON ne passe jamais par les sondes HTML/texte (marqueur vérifié)
+            self._type_dispatch: Dict[type, Parser] = {dict: self.parsers[0]}
+            # Sonde multi-motifs : un seul balayage du texte indique les parsers personnalisés candidats
+            custom_table, complex_text = self.parsers[1], self.parsers[2]
+            self._marqueurs: Dict[str, str] = {
+                custom_table.config.name: custom_table.config.content_tags[1],
+                complex_text.config.name: complex_text.config.header_marker,
+            }
+            self._sonde = re.compile('|'.join(
+                f'(?P<{nom}>{re.escape(marqueur)})' for nom, marqueur in self._marqueurs.items()
+            ))
+
+        def _selection_par_sonde(self, content: Any, summary_soup: Optional[BeautifulSoup]) -> Optional[Parser]:
+            """Chaîne can_parse, limitée aux parsers personnalisés dont le marqueur a été vu"""
+            if not isinstance(content, str):
+                return super().get_parser(content, summary_soup)
+
+            declenches = set()
+            for m in self._sonde.finditer(content):
+                declenches.add(m.lastgroup)
+                if len(declenches) == len(self._marqueurs):
+                    break
+
+            for parser in self.parsers:
+                nom = parser.config.name
+                if nom in self._marqueurs and nom not in declenches:
+                    continue
+                if parser.can_parse(self._contenu_pour(parser, content, summary_soup)):
+                    logger.info(f"💡 Parser sélectionné: {nom}")
+                    return parser
+
+            logger.warning("⚠️ Aucun parser approprié trouvé")
+            return None
+
+        def get_parser(self, content: Any, summary_soup: Optional[BeautifulSoup] = None) -> Optional[Parser]:
+            """Dispatch par type, puis chaîne can_parse pré-filtrée par la sonde multi-motifs"""
+            parser = self._type_dispatch.get(type(content))
+            if parser is not None:
+                # Le type ne suffit pas : le parser dédié vérifie son marqueur (ex: 'decision_id')
+                if parser.can_parse(content):
+                    logger.info(f"💡 Parser sélectionné: {parser.config.name}")
+                    return parser
+                return super().get_parser(content, summary_soup)
+
+            # Pas de mémoïsation par empreinte : un parser retenu pour un autre contenu de même début
+            # ne vaut que si aucun parser prioritaire n'accepte celui-ci, ce que seule la chaîne vérifie
+            return self._selection_par_sonde(content, summary_soup)
 
     # Utilisation
     factory = ExtendedParserFactory()
@@ -340,6 +482,7 @@ def demo_custom_parsers():
     </ul>
     """
 
+    # HTML brut : CustomTableParser le parse une fois (arbre lxml mémoïsé entre les appels)
     refs2 = factory.extract_references_auto(html_content)
     decision2 = factory.parse_with_auto_detection(html_content, "", refs2)
     if decision2:
@@ -0,0 +1,72 @@
+'''
+Détection et extraction d'une wikitable à classes multiples (class="wikitable sortable")
+'''
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('myDLL')
+
+from bs4 import BeautifulSoup
+
+_RACINE = Path(__file__).resolve().parent.parent
+
+SOMMAIRE_MULTI_CLASSES = '''<div class="mw-parser-output">
+<table class="wikitable sortable"><tr><th>Authority:</th><td>CNIL (France)</td></tr>
+<tr><th>Decided:</th><td>1.03.2024</td></tr>
+<tr><th>Relevant Law:</th><td><a>Article 5(1)(a) GDPR</a><a>Article 6 GDPR</a></td></tr>
+<tr><th>Original Source:</th><td><a href="https://src.example/decision.pdf">x</a></td></tr></table>
+<h3><span id="Facts">Facts</span></h3><p>Some facts.</p></div>'''
+
+
+def _charger(nom_fichier: str):
+    '''
+    Charge un script du dépôt comme module (nom de fichier avec espaces possible)
+
+    :param nom_fichier: str - nom du script à la racine du dépôt
+    :return: module chargé
+    '''
+    spec = importlib.util.spec_from_file_location(Path(nom_fichier).stem.replace(' ', '_'), _RACINE / nom_fichier)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def v2():
+    return _charger('gdprhubRSS v2-1-a2.py')
+
+
+def test_v2_strainer_conserve_wikitable_multi_classes(v2):
+    soupe = BeautifulSoup(SOMMAIRE_MULTI_CLASSES, 'lxml', parse_only=v2._WIKITABLE_STRAINER)
+    assert soupe.find('table') is not None
+
+
+def test_v2_references_et_source_wikitable_multi_classes(v2):
+    soupe = BeautifulSoup(SOMMAIRE_MULTI_CLASSES, 'lxml', parse_only=v2._WIKITABLE_STRAINER)
+    assert v2.obtenir_references_textuelles(SOMMAIRE_MULTI_CLASSES, summary_soup=soupe) == ['5(1)(a)RGPD', '6RGPD']
+    assert v2.extract_url_src(soupe) == 'https://src.example/decision.pdf'
+
+
+@pytest.fixture(scope='module')
+def refactored():
+    return _charger('gdprhubRSS_refactored.py')
+
+
+def test_refactored_sonde_et_parsing_wikitable_multi_classes(refactored):
+    parser = refactored.WikitableParser(refactored.WikitableParserConfig())
+    assert parser.can_parse(SOMMAIRE_MULTI_CLASSES)
+    assert parser.extract_references(SOMMAIRE_MULTI_CLASSES) == ['5(1)(a)RGPD', '6RGPD']
+    decision = parser.parse_content(SOMMAIRE_MULTI_CLASSES, '', [])
+    assert decision is not None and decision.juridiction == 'CNIL'
+
+
+def test_refactored_sonde_ignore_classe_voisine(refactored):
+    parser = refactored.WikitableParser(refactored.WikitableParserConfig())
+    assert not parser.can_parse('<table class="wikitable-like"><tr><td>x</td></tr></table>')
+
+
+def test_refactored_cellule_commentaire_seul(refactored):
+    cellules = BeautifulSoup('<table><tr><td><!-- note --></td><td> a <!-- x --> b </td></tr></table>', 'lxml').find_all('td')
+    assert [refactored._cell_text(c) for c in cellules] == [c.get_text(strip=True) for c in cellules] == ['', 'ab']